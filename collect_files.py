@@ -1,18 +1,167 @@
 import os
+import errno
+import stat
 import shutil
 import re
+import time
+import threading
+import functools
 import concurrent.futures
+from dataclasses import dataclass
 
 import nuke
 
+# Set COLLECT_DEBUG=1 to log every copied frame
+DEBUG = os.environ.get('COLLECT_DEBUG', '') not in ('', '0')
+# Minimum seconds between progress UI updates while copying
+UI_INTERVAL = 0.1
+
+# Collected file paths are written relative to the saved script's folder
+ROOT_TMPL = '[file dirname [value root.name]]/footage/'
+
+# Upper bound on files per pool job in run_plan, to cut executor queue overhead
+COPY_CHUNKSIZE = 32
+
+# 1MB buffer: far fewer syscalls per frame than shutil's default chunk size
+COPY_BUFSIZE = 1 << 20
+
+# kernel32.CopyFile2, or None where unavailable (non-Windows, pre-Windows 8)
+_CopyFile2 = None
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+
+    _CopyFile2 = getattr(ctypes.windll.kernel32, 'CopyFile2', None)
+    if _CopyFile2 is not None:
+        _CopyFile2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+        _CopyFile2.restype = ctypes.HRESULT
+else:
+    import fcntl
+
+# ioctl request for a reflink (copy-on-write) clone on Linux
+FICLONE = 0x40049409
+# errnos meaning the kernel fast path is unavailable, not that the copy failed
+_KERNEL_COPY_UNSUPPORTED = (
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+    errno.EOPNOTSUPP, errno.ENOTTY
+    )
+
+# Various padding styles: %04d, %d, ####
+_PAD_RE = re.compile(r'(%0?\d*d|#+)')
+
+# Copy buffers are per thread, since copies run on a thread pool
+_local = threading.local()
+
+
+def _max_workers() -> int:
+    """
+    Get the copy pool size, overridable with the COLLECT_MAX_WORKERS env var.
+
+    Returns:
+        int: The number of copy worker threads.
+    """
+    try:
+        workers = int(os.environ.get('COLLECT_MAX_WORKERS', 0))
+    except ValueError:
+        workers = 0
+    if workers > 0:
+        return workers
+    # Copies are I/O-bound, so use more threads than cores
+    return min(32, (os.cpu_count() or 4) * 4)
+
+
+def _copy_buffer() -> tuple:
+    """
+    Return this thread's reusable copy buffer and a memoryview of it.
+
+    Returns:
+        tuple: A tuple containing the bytearray and its memoryview.
+    """
+    if not hasattr(_local, 'buf'):
+        _local.buf = bytearray(COPY_BUFSIZE)
+        _local.mv = memoryview(_local.buf)
+    return _local.buf, _local.mv
+
+
+def _check_same_file(src: str, dst: str, st: os.stat_result) -> None:
+    """
+    Refuse to copy a file onto itself, which would truncate it before reading.
+
+    Args:
+        src (str): The source file path.
+        dst (str): The destination file path.
+        st (os.stat_result): A stat result of src.
+
+    Raises:
+        shutil.SameFileError: If dst exists and is the same file as src.
+    """
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        return
+    if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+
+@functools.lru_cache(maxsize=4096)
+def _split(path: str) -> tuple:
+    """
+    Parse a file path into the parts the collector needs.
+
+    Args:
+        path (str): The raw file path.
+
+    Returns:
+        tuple: (norm, dirpath, basename, ext_lower, dirname)
+    """
+    norm = os.path.normpath(path)
+    dirpath, basename = os.path.split(norm)
+    ext_lower = os.path.splitext(basename)[1][1:].lower()
+    dirname = os.path.basename(dirpath)
+    return norm, dirpath, basename, ext_lower, dirname
+
+
+@dataclass(frozen=True)
+class NodePath:
+    """
+    A node's file path, parsed once and shared by planning and rewriting.
+    """
+    raw: str
+    norm: str
+    dirpath: str
+    basename: str
+    ext_lower: str
+    dirname: str
+
+    @classmethod
+    def from_path(cls, path: str) -> 'NodePath':
+        return cls(path, *_split(path))
+
+
 class FileCollector:
     def __init__(self):
-        self.video_exts = (
+        self.video_exts = frozenset({
             'mov', 'avi', 'mp4', 'mpeg', 'mpg', 
             'r3d', 'mxf', 'mkv', 'flv', 'webm'
-            )
+            })
         self.task = nuke.ProgressTask("Collecting Files")
         self.cancelled = False
+        self._max_workers = _max_workers()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        # Source stat results by normalized path, valid for one collect() run
+        self._stat_cache = {}
+        # Device ids of output directories, valid for one collect() run
+        self._dir_dev_cache = {}
+        # Output directories already created during this collect() run
+        self._ensured_dirs = set()
+        # Nodes whose collected path is taken by another node's file, mapped to that node
+        self._collisions = {}
+        # Copy jobs dropped by _claim because their destination was already taken
+        self._skipped = 0
+        # Copy messages from worker threads, printed together when collect() ends
+        self._log = []
+        self._log_lock = threading.Lock()
 
     def show_panel(self) -> tuple:
         """
@@ -28,108 +177,352 @@ class FileCollector:
         panel.addButton("OK")
         return panel.show(), panel.value("Output Path:")
 
-    def has_knob(self, node: nuke.Node, knob: str) -> bool:
-        return knob in node.knobs()
+    @staticmethod
+    def _kernel_copy(src: str, dst: str, same_fs: bool) -> bool:
+        """
+        Copy file data from src to dst without going through userspace.
+        A reflink clone is tried first when both are on the same filesystem,
+        then os.copy_file_range (server-side copy on NFSv4.2).
+
+        Args:
+            src (str): The source file path.
+            dst (str): The destination file path.
+            same_fs (bool): Whether src and the folder of dst share a device.
 
-    def copy_file(self, src: str, dst: str) -> None:
+        Returns:
+            bool: True if the data was copied, False if unsupported here.
         """
-        Copy a single file from src to dst.
+        if not hasattr(os, 'copy_file_range'):
+            return False
+
+        with open(src, 'rb') as src_fd, open(dst, 'wb') as dst_fd:
+            if same_fs:
+                try:
+                    fcntl.ioctl(dst_fd.fileno(), FICLONE, src_fd.fileno())
+                    return True
+                except OSError as e:
+                    if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                        raise
+            try:
+                while os.copy_file_range(src_fd.fileno(), dst_fd.fileno(), 1 << 30):
+                    pass
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+                return False
+        return True
+
+    def _ensure_dir(self, path: str) -> None:
+        """
+        Create a directory if needed, skipping paths already ensured this run.
+
+        Args:
+            path (str): The directory path.
+        """
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+
+    def _stat(self, path: str) -> os.stat_result:
+        """
+        Stat a normalized path, reusing the result for the rest of the collect.
+
+        Args:
+            path (str): The normalized file path.
+
+        Returns:
+            os.stat_result: The stat result of the path.
+        """
+        st = self._stat_cache.get(path)
+        if st is None:
+            st = os.stat(path)
+            self._stat_cache[path] = st
+        return st
+
+    def _dir_dev(self, path: str) -> int:
+        """
+        Get the device id of a directory, statting each directory only once.
+
+        Args:
+            path (str): The directory path.
+
+        Returns:
+            int: The st_dev of the directory.
+        """
+        dev = self._dir_dev_cache.get(path)
+        if dev is None:
+            dev = os.stat(path or os.curdir).st_dev
+            self._dir_dev_cache[path] = dev
+        return dev
+
+    def _fast_copy(self, src: str, dst: str, st: os.stat_result = None) -> None:
+        """
+        Copy file data and metadata from src to dst, like shutil.copy2 but
+        with a large reusable buffer. On Windows, CopyFile2 is used when
+        available so the OS can do server-side or block-cloned copies;
+        elsewhere the kernel copy path is tried first.
 
         Args:
             src (str): The source file path.
             dst (str): The destination file path.
+            st (os.stat_result, optional): A stat result of src. When given,
+                its times and mode are applied to dst without statting again.
+        """
+        src_st = st or os.stat(src)
+        # Every copy path below opens or replaces dst, so this must come first
+        _check_same_file(src, dst, src_st)
+
+        if _CopyFile2 is not None:
+            # HRESULT restype raises OSError on failure
+            _CopyFile2(src, dst, None)
+            return
+
+        same_fs = src_st.st_dev == self._dir_dev(os.path.dirname(dst))
+        if not self._kernel_copy(src, dst, same_fs):
+            buf, mv = _copy_buffer()
+            with open(src, 'rb') as src_fd, open(dst, 'wb') as dst_fd:
+                while True:
+                    n = src_fd.readinto(buf)
+                    if not n:
+                        break
+                    dst_fd.write(mv[:n])
+
+        if st is None:
+            shutil.copystat(src, dst)
+        else:
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+            os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+    def copy_file(self, src: str, dst: str) -> bool:
+        """
+        Copy a single file from src to dst.
+
+        Args:
+            src (str): The normalized source file path.
+            dst (str): The normalized destination file path.
+
+        Returns:
+            bool: True if the file was copied, False if it failed.
         """
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        
         try:
-            if os.path.exists(src):
-                shutil.copy2(src, dst)
-                nuke.tprint(f"[COPY] {src} -> {dst}")
-            else:
-                nuke.tprint(f"[ERROR] Source file does not exist: {src}")
+            st = self._stat(src)
+        except FileNotFoundError:
+            nuke.tprint(f"[ERROR] Source file does not exist: {src}")
+            return False
+        except OSError as e:
+            nuke.tprint(f"[EXCEPTION] Copy failed: {src} -> {dst}\n{e}")
+            return False
+
+        try:
+            self._fast_copy(src, dst, st)
         except Exception as e:
             nuke.tprint(f"[EXCEPTION] Copy failed: {src} -> {dst}\n{e}")
+            return False
+
+        with self._log_lock:
+            self._log.append(f"[COPY] {src} -> {dst}")
+        return True
 
-    def copy_sequence_parallel(
+    def iter_frame_jobs(
         self, 
-        file_path: str, 
+        node_path: NodePath, 
         output_dir: str, 
         frame_start: int, 
-        frame_end: int) -> None:
+        frame_end: int):
         """
-        Copy an image sequence in parallel using threading.
+        Yield the copy jobs for an image sequence, without copying anything.
 
         Args:
-            file_path (str): The path to the image sequence file.
-            output_dir (str): The directory where the copied files will be saved.
+            node_path (NodePath): The parsed path of the image sequence.
+            output_dir (str): The normalized directory where the copied files will be saved.
             frame_start (int): The starting frame number.
             frame_end (int): The ending frame number.
+
+        Yields:
+            tuple: A (src, dst) tuple for each existing frame.
         """
-        basename = os.path.basename(file_path)
-        dirpath = os.path.dirname(file_path)
-        dirname = os.path.basename(dirpath)
-        new_dir = os.path.join(output_dir, dirname)
-        os.makedirs(new_dir, exist_ok=True)
+        basename = node_path.basename
+        dirpath = node_path.dirpath
+        new_dir = os.path.join(output_dir, node_path.dirname)
+        self._ensure_dir(new_dir)
 
-        nuke.tprint(f"[INFO] Copying sequence: {basename} (Frames {frame_start}~{frame_end})")
+        nuke.tprint(f"[INFO] Planning sequence: {basename} (Frames {frame_start}~{frame_end})")
         nuke.tprint(f"[INFO] Output folder: {new_dir}")
 
-        # Various padding styles: %04d, %d, ####
-        match = re.search(r'(%0?\d*d|#+)', basename)
+        match = _PAD_RE.search(basename)
         if not match:
             nuke.tprint(f"[ERROR] No recognized padding found in: {basename}")
             return
 
         pad_token = match.group(1)
         if pad_token.startswith('%'):
-            pad_search = re.search(r'\d+', pad_token)
-            pad_len = int(pad_search.group()) if pad_search else 1
-            pattern = r'%0?\d*d'
+            digits = pad_token[1:-1]
+            pad_len = int(digits) if digits else 1
         else:
             pad_len = len(pad_token)
-            pattern = r'#+'
+        prefix = basename[:match.start()]
+        suffix = basename[match.end():]
+
+        if dirpath == new_dir:
+            nuke.tprint(f"[INFO] Sequence already in the output folder: {basename}")
+            return
 
-        tasks = []
+        # One directory listing instead of a stat per frame
+        try:
+            with os.scandir(dirpath or os.curdir) as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
+        except OSError as e:
+            nuke.tprint(f"[ERROR] Cannot read sequence folder: {dirpath}\n{e}")
+            return
+
+        # Join the separator once; plain concatenation per frame is much cheaper
+        src_prefix = os.path.join(dirpath, '')
+        dst_prefix = os.path.join(new_dir, '')
+        missing = 0
         for frame in range(frame_start, frame_end + 1):
-            frame_str = str(frame).zfill(pad_len)
-            file_name = re.sub(pattern, frame_str, basename)
-            src = os.path.join(dirpath, file_name)
-            dst = os.path.join(new_dir, file_name)
-            tasks.append((src, dst, file_name))
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            for src, dst, name in tasks:
-                if self.task.isCancelled():
-                    self.cancelled = True
-                    break
-                nuke.tprint(f"[FRAME] Copying frame {name}")
-                self.task.setMessage(f"Collecting frame: {name}")
-                futures.append(executor.submit(self.copy_file, src, dst))
-            concurrent.futures.wait(futures)
-
-    def update_node_path(self, node: nuke.Node) -> None:
+            file_name = f"{prefix}{frame:0{pad_len}d}{suffix}"
+            src = src_prefix + file_name
+            if os.path.normcase(file_name) not in existing:
+                # normcase is a no-op on macOS, where the filesystem is usually
+                # case-insensitive; confirm with a stat before calling it missing
+                try:
+                    self._stat_cache[src] = os.stat(src)
+                except OSError:
+                    missing += 1
+                    continue
+            yield src, dst_prefix + file_name
+
+        if missing:
+            nuke.tprint(f"[WARNING] {missing} frames missing from: {basename}")
+
+    def _claim(self, owners: dict, src: str, dst: str, node_name: str) -> bool:
         """
-        Update the file path of a node to the new collected location.
+        Register src as the file copied to dst, unless dst is already taken.
+        When a different source already owns dst, the node is recorded in
+        self._collisions and a warning is printed once for it. Every dropped
+        job is counted in self._skipped.
 
         Args:
-            node (nuke.Node): The node whose file path is to be updated.
+            owners (dict): (src, node name) pairs already claimed, keyed by destination.
+            src (str): The normalized source file path.
+            dst (str): The normalized destination file path.
+            node_name (str): The name of the node reading src.
+
+        Returns:
+            bool: True if the copy should run, False if it is a duplicate.
         """
-        file_path = node['file'].value()
-        basename = os.path.basename(file_path)
-        if self.has_knob(node, 'first') and node['first'].value() != node['last'].value() and os.path.splitext(file_path)[-1][1:].lower() not in self.video_exts:
-            subdir = os.path.basename(os.path.dirname(file_path))
-            new_path = f'[file dirname [value root.name]]/footage/{subdir}/{basename}'
-        else:
-            new_path = f'[file dirname [value root.name]]/footage/{basename}'
-        nuke.tprint(f"[UPDATE] Node {node.name()} file path updated to: {new_path}")
-        node['file'].setValue(new_path)
+        owner = owners.get(dst)
+        if owner is None:
+            owners[dst] = (src, node_name)
+            return True
+
+        self._skipped += 1
+        owner_src, owner_node = owner
+        if owner_src != src and node_name not in self._collisions:
+            self._collisions[node_name] = owner_node
+            nuke.tprint(
+                f"[WARNING] Node {node_name} reads {src}, but {owner_node} already "
+                f"collects {owner_src} to {dst}. {node_name} will read {owner_node}'s file."
+                )
+        return False
+
+    def _copy_chunk(self, chunk: list) -> int:
+        return sum(self.copy_file(src, dst) for src, dst in chunk)
+
+    def run_plan(self, plan: list, pending: dict) -> tuple:
+        """
+        Copy every planned file on the shared copy pool, and wait for copies
+        already started. Files are handed to the pool in chunks so small
+        frames are not dominated by queue overhead. Progress and cancellation
+        cover both.
+
+        Args:
+            plan (list): A list of (src, dst) tuples not yet submitted.
+            pending (dict): Chunks already submitted, keyed by their future.
+
+        Returns:
+            tuple: The number of files copied and the number that failed.
+        """
+        futures = dict(pending)
+        if plan:
+            # Keep several chunks per worker so short plans still use every thread
+            chunksize = max(1, min(COPY_CHUNKSIZE, len(plan) // (self._max_workers * 4)))
+            for i in range(0, len(plan), chunksize):
+                chunk = plan[i:i + chunksize]
+                futures[self._pool.submit(self._copy_chunk, chunk)] = chunk
+
+        total = sum(len(chunk) for chunk in futures.values())
+        if not total:
+            return 0, 0
+
+        done = 0
+        copied = 0
+        remaining = set(futures)
+        while remaining:
+            # The timeout paces UI calls, which run on the main thread
+            finished, remaining = concurrent.futures.wait(remaining, timeout=UI_INTERVAL)
+            for future in finished:
+                chunk = futures[future]
+                done += len(chunk)
+                copied += future.result()
+                if DEBUG:
+                    for src, dst in chunk:
+                        nuke.tprint(f"[FILE] Processed {os.path.basename(src)}")
+                last_src = chunk[-1][0]
+
+            self.task.setProgress(done * 100 // total)
+            if finished:
+                self.task.setMessage(f"Collecting file: {os.path.basename(last_src)}")
+            if self.task.isCancelled():
+                self.cancelled = True
+                # Copies already running finish; the rest never start
+                for future in remaining:
+                    future.cancel()
+                break
+
+        failed = done - copied
+        if not self.cancelled:
+            self.task.setProgress(100)
+            self.task.setMessage(f"Collected {copied} files, {failed} failed")
+            nuke.tprint(f"[INFO] Copied {copied} of {total} files, {failed} failed")
+        return copied, failed
+
+    def collected_path(self, node_path: NodePath, is_sequence: bool) -> str:
+        """
+        Build the file path a node should point at once collected.
+
+        Args:
+            node_path (NodePath): The parsed current file path of the node.
+            is_sequence (bool): Whether the node reads an image sequence.
+
+        Returns:
+            str: The new file path, relative to the saved script via TCL.
+        """
+        if is_sequence:
+            return ROOT_TMPL + node_path.dirname + '/' + node_path.basename
+        return ROOT_TMPL + node_path.basename
 
     def collect(self) -> None:
         """
         Main function to collect files used in the Nuke script.
         """
+        try:
+            self._collect()
+        finally:
+            self._pool.shutdown(wait=True)
+            self._flush_log()
+            self._stat_cache.clear()
+            self._dir_dev_cache.clear()
+            self._ensured_dirs.clear()
+
+    def _flush_log(self) -> None:
+        with self._log_lock:
+            log, self._log = self._log, []
+        if log:
+            nuke.tprint("\n".join(log))
+
+    def _collect(self) -> None:
         result, target_path = self.show_panel()
         if result != 1 or not target_path:
             nuke.tprint("[CANCELLED] Collect cancelled or no output path specified.")
@@ -141,19 +534,27 @@ class FileCollector:
 
         if not os.path.exists(target_path):
             if nuke.ask("Directory does not exist. Create now?"):
-                os.makedirs(target_path)
+                self._ensure_dir(target_path)
             else:
                 nuke.message("Cannot proceed without valid target directory.")
                 return
 
-        footage_path = os.path.join(target_path, "footage")
-        os.makedirs(footage_path, exist_ok=True)
+        footage_path = os.path.normpath(os.path.join(target_path, "footage"))
+        self._ensure_dir(footage_path)
 
         script_name = os.path.basename(nuke.root()['name'].value())
         self.convert_gizmo_to_group()
         
         all_nodes = nuke.allNodes()
-
+        plan = []
+        # Single-file copies started while the remaining nodes are planned,
+        # as {future: [(src, dst)]}
+        pending = {}
+        owners = {}
+        # (node, new file path) pairs, applied after the script is saved
+        rewrite_list = []
+
+        # Pass 1: gather every copy job in the script
         for i, node in enumerate(all_nodes):
             if self.task.isCancelled():
                 self.cancelled = True
@@ -162,57 +563,87 @@ class FileCollector:
             self.task.setProgress(i * 100 // len(all_nodes))
             self.task.setMessage(f"Processing node: {node.name()}")
 
-            if not self.has_knob(node, 'file') or self.has_knob(node, 'Render'):
+            knobs = node.knobs()
+            if 'file' not in knobs or 'Render' in knobs:
                 continue
 
-            file_path = node['file'].value()
+            file_path = knobs['file'].value()
             if not file_path:
                 continue
 
-            ext = os.path.splitext(file_path)[-1][1:].lower()
-
-            if ext in self.video_exts:
-                dst = os.path.join(footage_path, os.path.basename(file_path))
-                self.copy_file(file_path, dst)
-            elif self.has_knob(node, 'first'):
-                first = int(node['first'].value())
-                last = int(node['last'].value())
-                if first == last:
-                    dst = os.path.join(footage_path, os.path.basename(file_path))
-                    self.copy_file(file_path, dst)
-                else:
-                    self.copy_sequence_parallel(file_path, footage_path, first, last)
+            node_path = NodePath.from_path(file_path)
+            node_is_video = node_path.ext_lower in self.video_exts
+            is_sequence = False
+            if not node_is_video and 'first' in knobs:
+                first = int(knobs['first'].value())
+                last = int(knobs['last'].value())
+                is_sequence = first != last
+
+            if is_sequence:
+                # Frames are claimed as they are generated, so duplicates never reach the plan
+                frames = self.iter_frame_jobs(node_path, footage_path, first, last)
+                plan.extend(job for job in frames if self._claim(owners, *job, node.name()))
             else:
-                dst = os.path.join(footage_path, os.path.basename(file_path))
-                self.copy_file(file_path, dst)
+                dst = os.path.join(footage_path, node_path.basename)
+                if dst == node_path.norm:
+                    nuke.tprint(f"[INFO] File already in the output folder: {dst}")
+                elif self._claim(owners, node_path.norm, dst, node.name()):
+                    chunk = [(node_path.norm, dst)]
+                    pending[self._pool.submit(self._copy_chunk, chunk)] = chunk
+
+            rewrite_list.append((node, self.collected_path(node_path, is_sequence)))
+
+        if self._skipped:
+            nuke.tprint(f"[INFO] Skipped {self._skipped} duplicate copies")
+
+        # Pass 2: copy all sequence frames at once so workers never sit idle between
+        # nodes, and wait on the single-file copies with the same progress and cancel
+        if not self.cancelled:
+            self.run_plan(plan, pending)
 
         if self.cancelled:
+            for future in pending:
+                future.cancel()
             nuke.message("Collect cancelled.")
             return
 
+        self._flush_log()
+
         new_script_path = os.path.join(target_path, script_name)
         nuke.scriptSaveAs(new_script_path)
 
-        for node in all_nodes:
-            if self.has_knob(node, 'file') and not self.has_knob(node, 'Render'):
-                self.update_node_path(node)
+        for node, new_path in rewrite_list:
+            nuke.tprint(f"[UPDATE] Node {node.name()} file path updated to: {new_path}")
+            node['file'].setValue(new_path)
+
+        if self._collisions:
+            details = "\n".join(
+                f"{node_name} (now reads {owner_node}'s file)"
+                for node_name, owner_node in self._collisions.items()
+                )
+            nuke.tprint(f"Collect done with {len(self._collisions)} path collisions.")
+            nuke.message(
+                f"Collect done, but {len(self._collisions)} nodes collided with "
+                f"another node's footage path:\n{details}"
+                )
+            return
 
         nuke.tprint("Collect done!")
         nuke.message("Collect done!")
         
     def convert_gizmo_to_group(self):
-        if not nuke.allNodes():
+        all_nodes = nuke.allNodes()
+        if not all_nodes:
             return
-        no_gizmo_selection = []
-        gizmo_selection = []
-        for node in nuke.allNodes():
-            if 'gizmo_file' in node.knobs():
-                gizmo_selection.append(node)
-            else:
-                no_gizmo_selection.append(node)
-        group_selection = []
+        prev_selected = {n.name() for n in nuke.selectedNodes()}
+        gizmo_selection = [node for node in all_nodes if 'gizmo_file' in node.knobs()]
         error_selection = []
 
+        # Clear the selection once; after that only the last gizmo needs deselecting
+        for n in all_nodes:
+            n.knob('selected').setValue(False)
+        prev_gizmo = None
+
         for node in gizmo_selection:
             # Current Status Variables
             node_name = node.knob('name').value()
@@ -228,9 +659,10 @@ class FileCollector:
             input_list = []
 
             # Current Node Isolate Selection
-            for n in nuke.allNodes():
-                n.knob('selected').setValue(False)
+            if prev_gizmo is not None:
+                prev_gizmo.knob('selected').setValue(False)
             node.knob('selected').setValue(True)
+            prev_gizmo = node
             
             try:
                 nuke.tcl('copy_gizmo_to_group [selected_node]')
@@ -244,7 +676,6 @@ class FileCollector:
                     continue
 
             # Refresh selections
-            group_selection.append(nuke.selectedNode())
             new_group = nuke.selectedNode()
 
             # Paste Attributes
@@ -272,13 +703,12 @@ class FileCollector:
 
         # Cleanup (remove gizmos, leave groups)
         for y in gizmo_selection:
-            y.knob('selected').setValue(True)
             nuke.delete(y)
-        for z in group_selection:
-            z.knob('selected').setValue(True)
-        for w in no_gizmo_selection:
-            w.knob('selected').setValue(True) 
-        
+
+        # Restore the previous selection; groups took over their gizmo's name
+        for n in nuke.allNodes():
+            n.knob('selected').setValue(n.name() in prev_selected)
+
         if error_selection:
             nuke.alert(f"Failed to convert {len(error_selection)} gizmos to groups.")
 